@@ -1,106 +1,184 @@
 import streamlit as st
-from datetime import datetime, timedelta
+import io
+from datetime import datetime
+from uuid import uuid4
 import pandas as pd
+import polars as pl
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import LabelEncoder
+from sklearn.linear_model import LogisticRegression
+from scipy.special import expit
 import matplotlib.pyplot as plt
 
-st.markdown("""
-<style>
-.task-card {
-    border-left: 4px solid #4CAF50;
-    border-radius: 4px;
-    padding: 16px;
-    margin: 8px 0;
-    background-color: transparent;
-    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    transition: all 0.3s ease;
-}
-.task-card:hover {
-    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-}
-.task-card h3 {
-    margin-top: 0;
-    color: var(--text-color);
-}
-.task-card p {
-    margin-bottom: 0;
-    color: var(--text-color-secondary);
-}
-button[title] {
-    font-size: 20px;
-    background: none;
-    border: none;
-    cursor: pointer;
-    margin-right: 10px;
-}
-</style>
-""", unsafe_allow_html=True)
+PRIORITIES = ["Low", "Medium", "High"]
+_PRI_MAP = {"Low": 0, "Medium": 1, "High": 2}
+PRIORITY_COLORS = {"Low": "#4CAF50", "Medium": "#ffa500", "High": "#ff4b4b"}
+
+class TaskStore:
+    """Column-oriented task storage: one array per field instead of a list of dicts"""
+
+    def __init__(self):
+        # key identifies this session's store; version is bumped on every change
+        self.key = uuid4().hex
+        self.version = 0
+        self.next_id = 1
+        self.id = np.empty(0, dtype=np.int64)
+        self.description = np.empty(0, dtype=object)
+        self.due_date = np.empty(0, dtype='datetime64[D]')
+        self.priority = pd.Categorical([], categories=PRIORITIES)
+        self.created_at = np.empty(0, dtype='datetime64[s]')
+        self.completed = np.empty(0, dtype=bool)
+
+    def __len__(self):
+        return self.id.size
+
+    def append(self, description, due_date, priority):
+        """Add a new, not yet completed task"""
+        self.id = np.append(self.id, self.next_id)
+        self.description = np.append(self.description, np.array([description], dtype=object))
+        self.due_date = np.append(self.due_date, np.datetime64(due_date, 'D'))
+        self.priority = pd.Categorical.from_codes(
+            np.append(self.priority.codes, _PRI_MAP[priority]), categories=PRIORITIES
+        )
+        self.created_at = np.append(self.created_at, np.datetime64(datetime.now(), 's'))
+        self.completed = np.append(self.completed, False)
+        self.next_id += 1
+        self.version += 1
+
+    def delete(self, task_id):
+        """Remove the task with the given id"""
+        keep = self.id != task_id
+        self.id = self.id[keep]
+        self.description = self.description[keep]
+        self.due_date = self.due_date[keep]
+        self.priority = self.priority[keep]
+        self.created_at = self.created_at[keep]
+        self.completed = self.completed[keep]
+        self.version += 1
+
+    def set_completed(self, task_id, completed):
+        """Set the completed flag of the task with the given id"""
+        self.completed[self.id == task_id] = completed
+        self.version += 1
+
+    def to_frame(self):
+        """Return the tasks as a DataFrame with the exported column layout"""
+        return pd.DataFrame({
+            "id": self.id,
+            "description": self.description,
+            "due_date": self.due_date.astype(object),
+            "priority": np.asarray(self.priority),
+            "created_at": self.created_at,
+            "completed": self.completed
+        })
+
+@st.cache_data(max_entries=32)
+def tasks_csv(store_key, version, _tasks):
+    """Encode the tasks as CSV bytes, recomputed only when the store changes"""
+    task_df = _tasks.to_frame()
+    task_df["created_at"] = task_df["created_at"].astype(str)
+    task_df["due_date"] = task_df["due_date"].astype(str)
+    return task_df.to_csv(index=False).encode("utf-8")
+
+def fit_model(X, y):
+    """Fit a logistic completion model and return its weights and bias"""
+    model = LogisticRegression().fit(X, y)
+    return model.coef_[0].astype(np.float32), np.float32(model.intercept_[0])
+
+def priority_summary(codes, is_completed, completion_prob):
+    """Per-priority task count, completion rate and predicted success rate"""
+    n = np.bincount(codes, minlength=len(PRIORITIES))
+    completed = np.bincount(codes, weights=is_completed, minlength=len(PRIORITIES))
+    predicted = np.bincount(codes, weights=completion_prob, minlength=len(PRIORITIES))
+    seen = n > 0
+    
+    return pd.DataFrame({
+        'Task Count': n[seen],
+        'Completion Rate': completed[seen] / n[seen],
+        'Predicted Success Rate': predicted[seen] / n[seen]
+    }, index=pd.Index(np.array(PRIORITIES)[seen], name='priority'))
 
 def analyze_productivity(tasks):
     """Analyze productivity using ML-based predictions"""
-    if not tasks:
-        return None, None
+    if not len(tasks):
+        return None, None, None
     
     try:
-        df = pd.DataFrame(tasks)
-        df['created_at'] = pd.to_datetime(df['created_at'])
-        df['due_date'] = pd.to_datetime(df['due_date'])
-        
-        # Calculate time-based features
-        df['days_to_due'] = (df['due_date'] - df['created_at']).dt.days
-        df['is_completed'] = df['completed'].astype(int)
+        # Calculate time-based features in a single lazy Polars pass over the task columns
+        # (priority is stored as fixed codes from _PRI_MAP and decoded to labels here)
+        df = pl.LazyFrame({
+            'description': pl.Series(values=tasks.description.astype(str)),
+            'due_date': tasks.due_date,
+            'created_at': tasks.created_at.astype('datetime64[ms]'),
+            'priority_encoded': tasks.priority.codes.astype(np.int8),
+            'completed': tasks.completed
+        }).with_columns(
+            (pl.col('due_date') - pl.col('created_at').dt.date()).dt.total_days().cast(pl.Int32).alias('days_to_due'),
+            pl.col('completed').cast(pl.Int64).alias('is_completed'),
+            pl.col('priority_encoded').replace_strict(
+                dict(enumerate(PRIORITIES)), return_dtype=pl.Enum(PRIORITIES)
+            ).alias('priority')
+        ).collect()
         
-        # Encode priority
-        le = LabelEncoder()
-        df['priority_encoded'] = le.fit_transform(df['priority'])
+        # Prepare features for ML as one contiguous float32 matrix
+        X = df.select('days_to_due', 'priority_encoded').cast(pl.Float32).to_numpy(order='c')
+        y = df['is_completed'].to_numpy()
         
-        # Prepare features for ML
-        features = ['days_to_due', 'priority_encoded']
-        X = df[features]
-        y = df['is_completed']
+        # Train a simple ML model (cached per store version by productivity_artifacts)
+        w, b = fit_model(X, y)
         
-        # Train a simple ML model
-        model = RandomForestClassifier(n_estimators=100, random_state=42)
-        model.fit(X, y)
+        # Calculate completion probability for each task: sigmoid(X @ w + b)
+        completion_prob = expit(X @ w + b)
+        df = df.with_columns(pl.Series('completion_probability', completion_prob))
         
-        # Calculate completion probability for each task
-        df['completion_probability'] = model.predict_proba(X)[:, 1]
+        # Per-priority statistics, shared by the plot and the table
+        priority_stats = priority_summary(df['priority_encoded'].to_numpy(), y, completion_prob)
         
         # Create visualization
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
         
         # Priority completion rate
-        priority_stats = df.groupby('priority')['is_completed'].mean()
-        priority_stats.plot(kind='bar', ax=ax1, color=['#ff4b4b', '#ffa500', '#4CAF50'])
+        bar_colors = [PRIORITY_COLORS[p] for p in priority_stats.index]
+        priority_stats['Completion Rate'].plot(kind='bar', ax=ax1, color=bar_colors)
         ax1.set_title('Completion Rate by Priority')
         ax1.set_ylabel('Completion Rate')
         
         # Days to due vs completion probability
-        df.plot(kind='scatter', x='days_to_due', y='completion_probability', ax=ax2)
+        ax2.scatter(df['days_to_due'].to_numpy(), completion_prob)
         ax2.set_title('Completion Probability vs Days to Due')
         ax2.set_xlabel('Days to Due Date')
         ax2.set_ylabel('Completion Probability')
         
         plt.tight_layout()
         
-        return df, fig
+        return df, priority_stats, fig
     except Exception as e:
         st.error(f"Error in productivity analysis: {str(e)}")
-        return None, None
+        return None, None, None
+
+@st.cache_data(max_entries=32)
+def productivity_artifacts(store_key, version, _tasks):
+    """Run the productivity analysis and render its figure to PNG, recomputed only when the store changes"""
+    df, priority_stats, fig = analyze_productivity(_tasks)
+    if fig is None:
+        return df, priority_stats, None
+    
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight')
+    plt.close(fig)
+    return df, priority_stats, buf.getvalue()
 
 def analyze_daily_productivity(tasks):
     """Analyze productivity for the current day and predict completion"""
-    today = datetime.now().date()
-    today_tasks = [task for task in tasks if task['due_date'] == today]
+    today = np.datetime64(datetime.now().date(), 'D')
+    mask = tasks.due_date == today
+    total_today = int(mask.sum())
     
-    if not today_tasks:
+    if total_today == 0:
         return None, None, None
     
     # Calculate completion rate for today
-    completed_today = sum(1 for task in today_tasks if task['completed'])
-    total_today = len(today_tasks)
+    completed_today = int(tasks.completed[mask].sum())
+    today_idx = np.flatnonzero(mask)
     completion_rate = (completed_today / total_today) * 100 if total_today > 0 else 0
     
     # Estimate time needed for remaining tasks
@@ -115,54 +193,119 @@ def analyze_daily_productivity(tasks):
     # Predict if tasks can be completed today
     can_complete = estimated_time_needed <= (remaining_hours * 60)
     
-    return today_tasks, completion_rate, can_complete
+    return today_idx, completion_rate, can_complete
+
+# Minutes allocated per priority code (Low, Medium, High)
+_DURATIONS = np.array([30, 45, 60], dtype=np.int64)
 
 def generate_timetable(tasks):
     """Generate a timetable for the day"""
-    today = datetime.now().date()
-    today_tasks = [task for task in tasks if task['due_date'] == today and not task['completed']]
+    today = np.datetime64(datetime.now().date(), 'D')
+    today_idx = np.flatnonzero((tasks.due_date == today) & ~tasks.completed)
     
-    if not today_tasks:
+    if today_idx.size == 0:
         return None
     
-    # Sort tasks by priority
-    priority_order = {"High": 1, "Medium": 2, "Low": 3}
-    today_tasks.sort(key=lambda x: priority_order[x["priority"]])
+    # Sort tasks by priority (High first)
+    today_idx = today_idx[np.argsort(-tasks.priority.codes[today_idx], kind='stable')]
+    
+    # Lay tasks out back to back, starting now
+    durations = _DURATIONS[tasks.priority.codes[today_idx]]
+    ends_min = durations.cumsum()
+    starts_min = ends_min - durations
+    now = np.datetime64(datetime.now(), 'm')
     
-    # Generate timetable
-    current_time = datetime.now()
-    timetable = []
+    timetable = pd.DataFrame({
+        "task": tasks.description[today_idx],
+        "priority": np.asarray(tasks.priority[today_idx]),
+        "start_time": now + starts_min.astype('timedelta64[m]'),
+        "end_time": now + ends_min.astype('timedelta64[m]'),
+        "duration": durations
+    })
     
-    for task in today_tasks:
-        # Allocate time based on priority
-        time_allocation = {
-            "High": 60,  # 1 hour
-            "Medium": 45,  # 45 minutes
-            "Low": 30  # 30 minutes
-        }
+    return timetable.to_dict('records')
+
+def apply_task_edits(tasks, editor_key, row_ids):
+    """Apply the completions and deletions made in the task editor to the store"""
+    changes = st.session_state[editor_key]
+    for row, edit in changes["edited_rows"].items():
+        if "completed" in edit:
+            tasks.set_completed(row_ids[row], edit["completed"])
+    for row in changes["deleted_rows"]:
+        tasks.delete(row_ids[row])
+
+@st.fragment
+def render_tasks(tasks):
+    """Render the task list; completing or deleting a task reruns only this fragment"""
+    # The analysis tab is not refreshed by these edits; it catches up on the
+    # next full run (e.g. adding a task or any widget outside this fragment)
+    if not len(tasks):
+        st.info("No tasks yet. Add some using the sidebar!")
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            show_completed = st.checkbox("Show completed tasks")
+        with col2:
+            sort_option = st.selectbox("Sort by", ["Creation Date", "Due Date", "Priority"])
         
-        task_time = time_allocation[task["priority"]]
-        start_time = current_time
-        end_time = start_time + timedelta(minutes=task_time)
+        if show_completed:
+            filtered_idx = np.arange(len(tasks))
+        else:
+            filtered_idx = np.flatnonzero(~tasks.completed)
         
-        timetable.append({
-            "task": task["description"],
-            "priority": task["priority"],
-            "start_time": start_time,
-            "end_time": end_time,
-            "duration": task_time
+        if sort_option == "Due Date":
+            filtered_idx = filtered_idx[np.argsort(tasks.due_date[filtered_idx], kind='stable')]
+        elif sort_option == "Priority":
+            filtered_idx = filtered_idx[np.argsort(-tasks.priority.codes[filtered_idx], kind='stable')]
+        else:
+            filtered_idx = filtered_idx[np.argsort(tasks.created_at[filtered_idx], kind='stable')[::-1]]
+
+        view = pd.DataFrame({
+            "completed": tasks.completed[filtered_idx],
+            "description": tasks.description[filtered_idx],
+            "priority": np.asarray(tasks.priority[filtered_idx]),
+            "due_date": tasks.due_date[filtered_idx],
+            "created_at": tasks.created_at[filtered_idx]
         })
         
-        current_time = end_time
-    
-    return timetable
+        # One editor for all tasks; the key follows the store version so a
+        # fresh editor (with no pending edits) is shown after every change
+        editor_key = f"tasks_editor_{tasks.version}"
+        st.data_editor(
+            view,
+            column_config={
+                "completed": st.column_config.CheckboxColumn("Done"),
+                "description": st.column_config.TextColumn("Task"),
+                "priority": st.column_config.TextColumn("Priority"),
+                "due_date": st.column_config.DateColumn("Due", format="MMM DD, YYYY"),
+                "created_at": st.column_config.DatetimeColumn("Created", format="MMM DD, YYYY HH:mm")
+            },
+            disabled=["description", "priority", "due_date", "created_at"],
+            hide_index=True,
+            num_rows="delete",
+            key=editor_key,
+            on_change=apply_task_edits,
+            args=(tasks, editor_key, tasks.id[filtered_idx])
+        )
+        
+        # Exportable dataset section
+        st.subheader("📊 Export Task Data")
+        st.write("Use this for productivity prediction or analysis.")
+
+        csv = tasks_csv(tasks.key, tasks.version, tasks)
+        st.download_button(
+            label="📥 Download Task Dataset as CSV",
+            data=csv,
+            file_name="tasks_dataset.csv",
+            mime="text/csv"
+        )
 
 def main():
     st.title("📝 To-Do List App")
     st.write("Organize your tasks with style!")
     
     if 'tasks' not in st.session_state:
-        st.session_state.tasks = []
+        st.session_state.tasks = TaskStore()
     
     # Sidebar for adding tasks
     with st.sidebar:
@@ -173,15 +316,7 @@ def main():
         
         if st.button("Add Task"):
             if new_task:
-                task = {
-                    "id": len(st.session_state.tasks) + 1,
-                    "description": new_task,
-                    "due_date": due_date,
-                    "priority": priority,
-                    "created_at": datetime.now(),
-                    "completed": False
-                }
-                st.session_state.tasks.append(task)
+                st.session_state.tasks.append(new_task, due_date, priority)
                 st.success("Task added successfully!")
             else:
                 st.warning("Please enter a task description")
@@ -192,88 +327,19 @@ def main():
     with tab1:
         st.header("Your Tasks")
         
-        if not st.session_state.tasks:
-            st.info("No tasks yet. Add some using the sidebar!")
-        else:
-            col1, col2 = st.columns(2)
-            with col1:
-                show_completed = st.checkbox("Show completed tasks")
-            with col2:
-                sort_option = st.selectbox("Sort by", ["Creation Date", "Due Date", "Priority"])
-            
-            filtered_tasks = [task for task in st.session_state.tasks if show_completed or not task["completed"]]
-            
-            if sort_option == "Due Date":
-                filtered_tasks.sort(key=lambda x: x["due_date"])
-            elif sort_option == "Priority":
-                order = {"High": 1, "Medium": 2, "Low": 3}
-                filtered_tasks.sort(key=lambda x: order[x["priority"]])
-            else:
-                filtered_tasks.sort(key=lambda x: x["created_at"], reverse=True)
-
-            for task in filtered_tasks:
-                border_color = {
-                    "High": "#ff4b4b",
-                    "Medium": "#ffa500",
-                    "Low": "#4CAF50"
-                }.get(task["priority"], "#4CAF50")
-
-                with st.form(key=f"form_{task['id']}"):
-                    st.markdown(
-                        f"""
-                        <div class="task-card" style="border-left-color: {border_color}; {'opacity: 0.6;' if task['completed'] else ''}">
-                            <h3>{task['description']}</h3>
-                            <p>📅 Due: {task['due_date'].strftime('%b %d, %Y')}</p>
-                            <p>🔖 Priority: {task['priority']}</p>
-                            <p>⏱ Created: {task['created_at'].strftime('%b %d, %Y %H:%M')}</p>
-                            <div style="margin-top: 10px;">
-                        """, unsafe_allow_html=True
-                    )
-
-                    colA, colB = st.columns([1, 1])
-                    with colA:
-                        complete = st.form_submit_button("✅", help="Mark Complete")
-                    with colB:
-                        delete = st.form_submit_button("🗑️", help="Delete Task")
-
-                    if complete:
-                        task["completed"] = not task["completed"]
-                        st.rerun()
-                    if delete:
-                        st.session_state.tasks = [t for t in st.session_state.tasks if t["id"] != task["id"]]
-                        st.rerun()
-
-                    st.markdown("</div></div>", unsafe_allow_html=True)
-            
-            # Exportable dataset section
-            task_df = pd.DataFrame(st.session_state.tasks)
-
-            if not task_df.empty:
-                task_df["created_at"] = task_df["created_at"].astype(str)
-                task_df["due_date"] = task_df["due_date"].astype(str)
-                
-                st.subheader("📊 Export Task Data")
-                st.write("Use this for productivity prediction or analysis.")
-
-                csv = task_df.to_csv(index=False).encode("utf-8")
-                st.download_button(
-                    label="📥 Download Task Dataset as CSV",
-                    data=csv,
-                    file_name="tasks_dataset.csv",
-                    mime="text/csv"
-                )
+        render_tasks(st.session_state.tasks)
     
     with tab2:
         st.header("Productivity Analysis")
         if len(st.session_state.tasks) > 0:
             # Daily Productivity Analysis
             st.subheader("📅 Today's Productivity")
-            today_tasks, completion_rate, can_complete = analyze_daily_productivity(st.session_state.tasks)
+            today_idx, completion_rate, can_complete = analyze_daily_productivity(st.session_state.tasks)
             
-            if today_tasks:
+            if today_idx is not None:
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    st.metric("Today's Tasks", len(today_tasks))
+                    st.metric("Today's Tasks", len(today_idx))
                 with col2:
                     st.metric("Completion Rate", f"{completion_rate:.1f}%")
                 with col3:
@@ -294,7 +360,8 @@ def main():
                     st.info("No remaining tasks for today!")
             
             # Original ML Analysis
-            df, fig = analyze_productivity(st.session_state.tasks)
+            tasks = st.session_state.tasks
+            df, priority_stats, fig_png = productivity_artifacts(tasks.key, tasks.version, tasks)
             if df is not None:
                 st.subheader("ML-Powered Insights")
                 
@@ -302,7 +369,7 @@ def main():
                 total_tasks = len(df)
                 completed_tasks = df['is_completed'].sum()
                 completion_rate = (completed_tasks / total_tasks) * 100
-                high_risk_tasks = df[df['completion_probability'] < 0.3]
+                high_risk_tasks = df.filter(pl.col('completion_probability') < 0.3)
                 
                 # Display metrics
                 col1, col2, col3 = st.columns(3)
@@ -314,24 +381,23 @@ def main():
                     st.metric("High Risk Tasks", len(high_risk_tasks))
                 
                 # Display visualizations
-                st.pyplot(fig)
+                st.image(fig_png)
                 
                 # Display recommendations
                 st.subheader("Recommendations")
                 if len(high_risk_tasks) > 0:
                     st.warning(f"⚠️ You have {len(high_risk_tasks)} high-risk tasks that need attention!")
-                    for _, task in high_risk_tasks.iterrows():
-                        st.write(f"- {task['description']} (Priority: {task['priority']})")
+                    st.markdown("\n".join(
+                        f"- {description} (Priority: {priority})"
+                        for description, priority in zip(
+                            high_risk_tasks['description'].to_numpy(),
+                            high_risk_tasks['priority'].to_numpy()
+                        )
+                    ))
                 
                 # Priority-based insights with improved styling
                 st.subheader("Priority Analysis")
-                priority_stats = df.groupby('priority').agg({
-                    'is_completed': ['count', 'mean'],
-                    'completion_probability': 'mean'
-                }).round(2)
-                
-                # Rename columns for better readability
-                priority_stats.columns = ['Task Count', 'Completion Rate', 'Predicted Success Rate']
+                priority_stats = priority_stats.round(2)
                 
                 # Style the dataframe
                 styled_stats = priority_stats.style.format({
@@ -1,41 +1,23 @@
 import streamlit as st
 from datetime import datetime
+from pathlib import Path
+from operator import itemgetter
 import pandas as pd
 
-st.markdown("""
-<style>
-.task-card {
-    border-left: 4px solid #4CAF50;
-    border-radius: 4px;
-    padding: 16px;
-    margin: 8px 0;
-    background-color: transparent;
-    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    transition: all 0.3s ease;
-}
-.task-card:hover {
-    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-}
-.task-card h3 {
-    margin-top: 0;
-    color: var(--text-color);
-}
-.task-card p {
-    margin-bottom: 0;
-    color: var(--text-color-secondary);
-}
-button[title] {
-    font-size: 20px;
-    background: none;
-    border: none;
-    cursor: pointer;
-    margin-right: 10px;
-}
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _load_css():
+    """Read the stylesheet once per server process"""
+    css = (Path(__file__).parent / "style.css").read_text()
+    return f"<style>\n{css}</style>"
+
+# Sort rank per priority, stored on each task so sorting needs no lookups
+_PRIORITY_CODE = {"High": 0, "Medium": 1, "Low": 2}
 
 
 def main():
+    # Streamlit drops elements that are not re-emitted, so the tag is
+    # sent every run; only reading the file is cached
+    st.markdown(_load_css(), unsafe_allow_html=True)
     st.title("📝 To-Do List App")
     st.write("Organize your tasks with style!")
     
@@ -56,6 +38,7 @@ def main():
                     "description": new_task,
                     "due_date": due_date,
                     "priority": priority,
+                    "priority_code": _PRIORITY_CODE[priority],
                     "created_at": datetime.now(),
                     "completed": False
                 }
@@ -80,8 +63,7 @@ def main():
         if sort_option == "Due Date":
             filtered_tasks.sort(key=lambda x: x["due_date"])
         elif sort_option == "Priority":
-            order = {"High": 1, "Medium": 2, "Low": 3}
-            filtered_tasks.sort(key=lambda x: order[x["priority"]])
+            filtered_tasks.sort(key=itemgetter("priority_code"))
         else:
             filtered_tasks.sort(key=lambda x: x["created_at"], reverse=True)
 
@@ -120,7 +102,7 @@ def main():
                 st.markdown("</div></div>", unsafe_allow_html=True)
     
         # Exportable dataset section
-    task_df = pd.DataFrame(st.session_state.tasks)
+    task_df = pd.DataFrame(st.session_state.tasks).drop(columns="priority_code", errors="ignore")
 
     if not task_df.empty:
         # Convert datetime objects to strings for CSV export
@@ -1,16 +1,24 @@
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report
-from sklearn.preprocessing import LabelEncoder
+import numpy as np
 import datetime
 
-# Load the exported CSV
-df = pd.read_csv("tasks_dataset.csv")
+# Fixed priority encoding, matching the app
+_PRI_MAP = {"Low": 0, "Medium": 1, "High": 2}
 
-# Convert date strings back to datetime
-df['created_at'] = pd.to_datetime(df['created_at'])
-df['due_date'] = pd.to_datetime(df['due_date'])
+# Load the exported CSV, parsing the date columns natively
+# (microsecond units also accept exports with fractional seconds)
+table = pv.read_csv(
+    "tasks_dataset.csv",
+    convert_options=pv.ConvertOptions(column_types={
+        'created_at': pa.timestamp('us'),
+        'due_date': pa.timestamp('us')
+    })
+)
+df = table.to_pandas()
 
 # Feature Engineering
 df['days_until_due'] = (df['due_date'] - df['created_at']).dt.days
@@ -18,8 +26,7 @@ df['hour_created'] = df['created_at'].dt.hour
 df['day_of_week_created'] = df['created_at'].dt.dayofweek
 
 # Encode priority into numerical values
-priority_encoder = LabelEncoder()
-df['priority_encoded'] = priority_encoder.fit_transform(df['priority'])
+df['priority_encoded'] = df['priority'].map(_PRI_MAP).to_numpy(np.int8)
 
 # Define features and target
 X = df[['days_until_due', 'hour_created', 'day_of_week_created', 'priority_encoded']]
@@ -28,9 +35,46 @@ y = df['completed'].astype(int)
 # Split the data
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-# Train a classifier
-clf = RandomForestClassifier(n_estimators=100, random_state=42)
-clf.fit(X_train, y_train)
+# Train a classifier, growing the forest 10 trees at a time until the
+# out-of-bag score has not improved for OOB_PATIENCE consecutive steps.
+# OOB scores of very small forests are noisy, so sizes below
+# MIN_ESTIMATORS are never kept
+OOB_TOLERANCE = 1e-3
+OOB_PATIENCE = 3
+MIN_ESTIMATORS = 50
+clf = RandomForestClassifier(
+    n_estimators=10,
+    max_features='sqrt',
+    n_jobs=-1,
+    random_state=42,
+    warm_start=True,
+    oob_score=True
+)
+best_oob, best_n, stale_steps = -1.0, 0, 0
+for n_estimators in range(10, 201, 10):
+    clf.n_estimators = n_estimators
+    clf.fit(X_train, y_train)
+    if n_estimators < MIN_ESTIMATORS:
+        continue
+    if clf.oob_score_ - best_oob >= OOB_TOLERANCE:
+        best_oob, best_n, stale_steps = clf.oob_score_, n_estimators, 0
+    else:
+        stale_steps += 1
+    if stale_steps >= OOB_PATIENCE:
+        break
+
+# Refit at the best size; with the same random_state these are exactly
+# the first best_n trees grown above
+if best_n < clf.n_estimators:
+    clf = RandomForestClassifier(
+        n_estimators=best_n,
+        max_features='sqrt',
+        n_jobs=-1,
+        random_state=42,
+        oob_score=True
+    )
+    clf.fit(X_train, y_train)
+print(f"Using {clf.n_estimators} trees (OOB score {clf.oob_score_:.3f})")
 
 # Evaluate
 y_pred = clf.predict(X_test)
@@ -38,4 +82,5 @@ print(classification_report(y_test, y_pred))
 
 # (Optional) Save the model
 import joblib
-joblib.dump(clf, 'task_completion_model.pkl')
+# LZ4 keeps the file small and is cheap to decompress on load
+joblib.dump(clf, 'task_completion_model.pkl', compress=('lz4', 3), protocol=5)